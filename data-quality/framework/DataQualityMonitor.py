@@ -10,14 +10,184 @@ It provides functionality for:
 """
 
 import os
+import gzip
 import json
 import logging
 import datetime
+import functools
+import math
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional, Union
+from urllib.parse import urlparse
 import boto3
+from botocore.config import Config
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import pandas as pd
-from pyspark.sql import SparkSession, DataFrame
-from pyspark.sql.functions import col, count, sum, when, isnan, isnull
+from py4j.protocol import Py4JJavaError
+from pyspark import StorageLevel
+from pyspark.sql import SparkSession, DataFrame, Column
+from pyspark.sql import functions as F
+from pyspark.sql.functions import col, count, sum, when, isnan, isnull, lit
+from pyspark.sql.utils import IllegalArgumentException
+from pyspark.sql.types import (
+    StructType, StructField, StringType, DoubleType, FloatType, LongType, BooleanType
+)
+
+# Check types whose metrics are simple aggregates and can be computed together
+# in a single pass over the table
+FUSIBLE_CHECK_TYPES = ("completeness", "uniqueness", "value_range", "pattern")
+
+# Check types that run_all_checks knows how to run
+CHECK_TYPES = FUSIBLE_CHECK_TYPES + ("referential_integrity",)
+
+# Name given to reference values when joining them against the checked column
+REF_VALUE_COLUMN = "__ref_value"
+
+# Name given to the number of source rows holding each checked value
+ROW_COUNT_COLUMN = "__row_count"
+
+# Largest relative standard deviation Spark's HyperLogLog++ accepts for
+# approximate distinct counts
+MAX_APPROX_RSD = 0.39
+
+# Check types that can be estimated from a sample. Sampled rules still ride the
+# full scan of the cached table, so sampling saves no I/O; it only pays off by
+# skipping costly per-row work, which for these checks is the regex match.
+# Null checks cost no more than the sample test itself, so they are not sampled.
+SAMPLED_CHECK_TYPES = ("pattern",)
+
+# Smallest expected sample size for which a rule's sampling settings are honoured;
+# smaller tables are checked in full
+MIN_SAMPLE_ROWS = 10000
+
+# Seed used when sampling rows so repeated runs check the same sample
+SAMPLE_SEED = 42
+
+# Column holding each row's uniform random value when sampled rules are fused
+SAMPLE_COLUMN = "__dq_sample"
+
+# Spark column types for which NaN counts as a missing value
+NAN_TYPES = (FloatType, DoubleType)
+
+# Maximum number of metrics CloudWatch accepts in a single PutMetricData call
+CLOUDWATCH_MAX_METRICS_PER_REQUEST = 1000
+
+# CloudWatch metric name and result field of the percentage each check type reports
+PERCENTAGE_METRICS = {
+    "completeness": ("NullPercentage", "null_percentage"),
+    "uniqueness": ("UniquePercentage", "unique_percentage"),
+    "pattern": ("PatternMatchPercentage", "match_percentage"),
+    "referential_integrity": ("ReferentialIntegrityPercentage", "valid_percentage"),
+}
+
+# Schema of the results dataset. Checked values and bounds can be numbers,
+# dates or strings depending on the column, so they are stored as strings to
+# keep every append compatible with the existing files.
+RESULTS_SCHEMA = StructType([
+    StructField("database", StringType()),
+    StructField("table", StringType()),
+    StructField("rule_id", StringType()),
+    StructField("rule_name", StringType()),
+    StructField("rule_description", StringType()),
+    StructField("severity", StringType()),
+    StructField("check_type", StringType()),
+    StructField("column", StringType()),
+    StructField("threshold", DoubleType()),
+    StructField("total_count", LongType()),
+    StructField("null_count", LongType()),
+    StructField("null_percentage", DoubleType()),
+    StructField("unique_count", LongType()),
+    StructField("unique_percentage", DoubleType()),
+    StructField("approximate", BooleanType()),
+    StructField("min_value", StringType()),
+    StructField("max_value", StringType()),
+    StructField("actual_min", StringType()),
+    StructField("actual_max", StringType()),
+    StructField("pattern", StringType()),
+    StructField("match_count", LongType()),
+    StructField("match_percentage", DoubleType()),
+    StructField("ref_database", StringType()),
+    StructField("ref_table", StringType()),
+    StructField("ref_column", StringType()),
+    StructField("invalid_count", LongType()),
+    StructField("valid_percentage", DoubleType()),
+    StructField("sample_fraction", DoubleType()),
+    StructField("passed", BooleanType()),
+    StructField("error", StringType()),
+    StructField("timestamp", StringType()),
+])
+
+# Python conversion applied to result values for each results dataset type
+RESULTS_TYPE_CONVERSIONS = {
+    StringType(): str,
+    DoubleType(): float,
+    LongType(): int,
+    BooleanType(): bool,
+}
+
+# Number of rules files, or versions of one file, whose text is kept in memory
+RULES_CACHE_SIZE = 32
+
+# Spark fair scheduler pool used for jobs submitted by concurrently running checks
+SCHEDULER_POOL = "data_quality"
+
+
+# AWS clients are created once per process and shared by every monitor, since
+# boto3 clients are thread-safe and expensive to construct
+@functools.lru_cache(maxsize=None)
+def _glue_client():
+    return boto3.client('glue')
+
+
+@functools.lru_cache(maxsize=None)
+def _cloudwatch_client():
+    return boto3.client('cloudwatch', config=Config(retries={"mode": "adaptive"}))
+
+
+@functools.lru_cache(maxsize=None)
+def _sns_client():
+    return boto3.client('sns')
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON, using orjson when it is installed.
+    
+    Values JSON cannot represent natively (e.g. Decimal min/max values) are
+    serialized as strings.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, default=str, indent=2 if indent else None).encode("utf-8")
+
+
+def _is_number(value: Any) -> bool:
+    """
+    Check whether a value is an int or float, as opposed to a bool or string.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+@functools.lru_cache(maxsize=RULES_CACHE_SIZE)
+def _read_rules_cached(rules_path: str, mtime: float) -> str:
+    """
+    Read a rules file, caching its text for monitors sharing the file.
+    
+    The file's modification time is part of the cache key so edits are
+    picked up without restarting the process. The text rather than the
+    parsed rules is cached, so each monitor parses its own rule dicts and
+    changes to one monitor's rules cannot leak into another's.
+    """
+    with open(rules_path, 'r') as f:
+        return f.read()
+
 
 class DataQualityMonitor:
     """
@@ -34,7 +204,8 @@ class DataQualityMonitor:
         table_name: str,
         rules_path: Optional[str] = None,
         metrics_path: Optional[str] = None,
-        log_level: str = "INFO"
+        log_level: str = "INFO",
+        max_workers: int = 8
     ):
         """
         Initialize the Data Quality Monitor.
@@ -46,12 +217,15 @@ class DataQualityMonitor:
             rules_path: Path to JSON file containing data quality rules
             metrics_path: Path to store metrics results
             log_level: Logging level
+            max_workers: Maximum number of rules to run concurrently; their
+                jobs only run in parallel under spark.scheduler.mode=FAIR
         """
         self.spark = spark
         self.database_name = database_name
         self.table_name = table_name
         self.rules_path = rules_path
         self.metrics_path = metrics_path
+        self.max_workers = max_workers
         
         # Set up logging
         self.logger = logging.getLogger("DataQualityMonitor")
@@ -63,9 +237,36 @@ class DataQualityMonitor:
             self.logger.addHandler(handler)
         
         # Initialize AWS clients
-        self.glue_client = boto3.client('glue')
-        self.cloudwatch_client = boto3.client('cloudwatch')
-        self.sns_client = boto3.client('sns')
+        self.glue_client = _glue_client()
+        self.cloudwatch_client = _cloudwatch_client()
+        self.sns_client = _sns_client()
+        
+        # Distinct reference values loaded for referential integrity checks,
+        # keyed by (database, table, column). Only keys used by more than one
+        # rule in the current run are cached.
+        self._ref_values: Dict[tuple, DataFrame] = {}
+        self._ref_values_lock = threading.Lock()
+        self._shared_ref_keys: set = set()
+        
+        # Row counts per non-null value of columns checked by several
+        # referential integrity rules in the current run, keyed by column
+        self._value_counts_cache: Dict[str, DataFrame] = {}
+        
+        # Alerts queued by send_alert, published by a background thread that is
+        # started on the first alert and stopped by flush_alerts
+        self._alert_queue: Optional[queue.Queue] = None
+        self._alert_thread: Optional[threading.Thread] = None
+        self._alert_thread_lock = threading.Lock()
+        
+        # Metrics queued by send_metrics_to_cloudwatch until flush_metrics
+        self._pending_metrics: List[Dict[str, Any]] = []
+        self._pending_metrics_lock = threading.Lock()
+        
+        # Row count of the table being checked, set once per run
+        self._total_count: Optional[int] = None
+        
+        # Timestamp shared by every result of a run, set once per run
+        self._run_timestamp: Optional[str] = None
         
         # Load rules if path is provided
         self.rules = []
@@ -78,8 +279,8 @@ class DataQualityMonitor:
         """
         try:
             self.logger.info(f"Loading rules from {self.rules_path}")
-            with open(self.rules_path, 'r') as f:
-                self.rules = json.load(f)
+            mtime = os.path.getmtime(self.rules_path)
+            self.rules = list(json.loads(_read_rules_cached(self.rules_path, mtime)))
             self.logger.info(f"Loaded {len(self.rules)} rules")
         except Exception as e:
             self.logger.error(f"Error loading rules: {str(e)}")
@@ -95,13 +296,30 @@ class DataQualityMonitor:
         try:
             self.logger.info(f"Loading data from {self.database_name}.{self.table_name}")
             df = self.spark.table(f"{self.database_name}.{self.table_name}")
-            self.logger.info(f"Loaded {df.count()} rows")
             return df
         except Exception as e:
             self.logger.error(f"Error loading data: {str(e)}")
             raise
     
-    def run_completeness_check(self, df: DataFrame, column: str, threshold: float) -> Dict[str, Any]:
+    def _check_timestamp(self) -> str:
+        """
+        Get the timestamp to record on a check result.
+        
+        Returns:
+            str: The run-level timestamp inside run_all_checks, otherwise the
+                current UTC time in ISO format
+        """
+        if self._run_timestamp is not None:
+            return self._run_timestamp
+        return datetime.datetime.now(datetime.timezone.utc).isoformat()
+    
+    def run_completeness_check(
+        self,
+        df: DataFrame,
+        column: str,
+        threshold: float,
+        total_count: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Check for null/missing values in a column.
         
@@ -109,29 +327,121 @@ class DataQualityMonitor:
             df: Spark DataFrame to check
             column: Column name to check
             threshold: Maximum allowed percentage of null values
+            total_count: Row count of df if already known, to avoid recounting
             
         Returns:
             Dict containing check results
         """
         self.logger.info(f"Running completeness check on column {column}")
         
-        total_count = df.count()
+        # Count rows and missing values in a single aggregation
+        stats = df.agg(
+            count("*").alias("total_count"),
+            sum(when(self._null_predicate(df, column), 1).otherwise(0)).alias("null_count")
+        ).first()
+        if total_count is None:
+            total_count = stats["total_count"]
+        null_count = stats["null_count"] or 0
+        
+        return self._completeness_result(column, threshold, null_count, total_count)
+    
+    @staticmethod
+    def _null_predicate(df: DataFrame, column: str) -> Column:
+        """
+        Build the predicate matching missing values in a column.
+        
+        NaN only exists for floating point columns, so isnan is applied to
+        those alone rather than coercing every other type. The column's type
+        is resolved by Spark, so references that differ in case or point into
+        a struct are typed the same way the check itself reads them.
+        
+        Args:
+            df: Spark DataFrame containing the column
+            column: Column name to build the predicate for
+            
+        Returns:
+            Column: Boolean expression that is true for missing values
+        """
+        if isinstance(df.select(column).schema[0].dataType, NAN_TYPES):
+            return col(column).isNull() | isnan(col(column))
+        return col(column).isNull()
+    
+    @staticmethod
+    def _top_level_column(column: str) -> str:
+        """
+        Get the top-level column a column reference resolves against.
+        
+        Args:
+            column: Column reference, e.g. "address.city" or "`order.id`"
+            
+        Returns:
+            str: Name of the top-level column, e.g. "address" or "order.id"
+        """
+        if column.startswith("`"):
+            return column[1:].split("`", 1)[0]
+        return column.split(".", 1)[0]
+    
+    @staticmethod
+    def _quote_column(column: str) -> str:
+        """
+        Quote a column name so Spark reads it literally, dots included.
+        
+        Args:
+            column: Name of a top-level column, e.g. "order.id"
+            
+        Returns:
+            str: Backtick-quoted column reference, e.g. "`order.id`"
+        """
+        return "`" + column.replace("`", "``") + "`"
+    
+    def _referenced_columns(self, columns: List[str]) -> List[str]:
+        """
+        Get the columns of a table that the rules reference.
+        
+        Spark resolves column names case-insensitively, so rule columns are
+        matched the same way. Columns no rule references are left out so they
+        are not cached.
+        
+        Args:
+            columns: Columns of the table being checked
+            
+        Returns:
+            List of referenced column names, in table order
+        """
+        referenced = set()
+        for rule in self.rules:
+            column = rule.get("column")
+            if isinstance(column, str):
+                referenced.add(self._top_level_column(column).lower())
+        
+        return [column for column in columns if column.lower() in referenced]
+    
+    def _completeness_result(
+        self,
+        column: str,
+        threshold: float,
+        null_count: int,
+        total_count: int
+    ) -> Dict[str, Any]:
+        """
+        Build the result of a completeness check from its computed counts.
+        
+        Args:
+            column: Column name that was checked
+            threshold: Maximum allowed percentage of null values
+            null_count: Number of null/NaN values in the column
+            total_count: Total number of rows
+            
+        Returns:
+            Dict containing check results
+        """
         if total_count == 0:
             self.logger.warning("DataFrame is empty")
-            return {
-                "check_type": "completeness",
-                "column": column,
-                "threshold": threshold,
-                "null_count": 0,
-                "total_count": 0,
-                "null_percentage": 0,
-                "passed": True,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
-        
-        null_count = df.filter(col(column).isNull() | isnan(column)).count()
-        null_percentage = (null_count / total_count) * 100
-        passed = null_percentage <= threshold
+            null_percentage = 0
+            passed = True
+        else:
+            null_percentage = (null_count / total_count) * 100
+            passed = null_percentage <= threshold
         
         result = {
             "check_type": "completeness",
@@ -141,13 +451,21 @@ class DataQualityMonitor:
             "total_count": total_count,
             "null_percentage": null_percentage,
             "passed": passed,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": self._check_timestamp()
         }
         
         self.logger.info(f"Completeness check result: {result}")
         return result
     
-    def run_uniqueness_check(self, df: DataFrame, column: str, threshold: float) -> Dict[str, Any]:
+    def run_uniqueness_check(
+        self,
+        df: DataFrame,
+        column: str,
+        threshold: float,
+        approximate: bool = False,
+        rsd: float = 0.02,
+        total_count: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Check for duplicate values in a column.
         
@@ -155,29 +473,63 @@ class DataQualityMonitor:
             df: Spark DataFrame to check
             column: Column name to check
             threshold: Minimum required percentage of unique values
+            approximate: Estimate the distinct count with HyperLogLog++ instead
+                of an exact distinct, avoiding a shuffle
+            rsd: Maximum relative standard deviation of the estimate when
+                approximate is set
+            total_count: Row count of df if already known, to avoid recounting
             
         Returns:
             Dict containing check results
         """
         self.logger.info(f"Running uniqueness check on column {column}")
         
-        total_count = df.count()
+        if total_count is None:
+            total_count = df.count()
+        unique_count = 0
+        if total_count > 0:
+            if approximate:
+                stats = df.agg(
+                    F.approx_count_distinct(col(column), rsd=rsd).alias("unique_count"),
+                    count(col(column)).alias("non_null_count")
+                ).first()
+                unique_count = stats["unique_count"]
+                # approx_count_distinct ignores nulls, whereas a distinct scan counts null as a value
+                if stats["non_null_count"] < total_count:
+                    unique_count += 1
+            else:
+                unique_count = df.select(column).distinct().count()
+        
+        return self._uniqueness_result(column, threshold, unique_count, total_count, approximate)
+    
+    def _uniqueness_result(
+        self,
+        column: str,
+        threshold: float,
+        unique_count: int,
+        total_count: int,
+        approximate: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Build the result of a uniqueness check from its computed counts.
+        
+        Args:
+            column: Column name that was checked
+            threshold: Minimum required percentage of unique values
+            unique_count: Number of distinct values in the column
+            total_count: Total number of rows
+            approximate: Whether unique_count is a HyperLogLog++ estimate
+            
+        Returns:
+            Dict containing check results
+        """
         if total_count == 0:
             self.logger.warning("DataFrame is empty")
-            return {
-                "check_type": "uniqueness",
-                "column": column,
-                "threshold": threshold,
-                "unique_count": 0,
-                "total_count": 0,
-                "unique_percentage": 0,
-                "passed": True,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
-        
-        unique_count = df.select(column).distinct().count()
-        unique_percentage = (unique_count / total_count) * 100
-        passed = unique_percentage >= threshold
+            unique_percentage = 0
+            passed = True
+        else:
+            unique_percentage = (unique_count / total_count) * 100
+            passed = unique_percentage >= threshold
         
         result = {
             "check_type": "uniqueness",
@@ -186,8 +538,9 @@ class DataQualityMonitor:
             "unique_count": unique_count,
             "total_count": total_count,
             "unique_percentage": unique_percentage,
+            "approximate": approximate,
             "passed": passed,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": self._check_timestamp()
         }
         
         self.logger.info(f"Uniqueness check result: {result}")
@@ -214,31 +567,54 @@ class DataQualityMonitor:
         """
         self.logger.info(f"Running value range check on column {column}")
         
-        # Filter out null values
-        filtered_df = df.filter(col(column).isNotNull())
+        # Get the non-null count and min/max values in one job; min and max
+        # ignore nulls, so no separate filter is needed
+        stats = df.agg(
+            count(col(column)).alias("non_null_count"),
+            F.min(col(column)).alias("actual_min"),
+            F.max(col(column)).alias("actual_max")
+        ).first()
+        non_null_count = stats["non_null_count"]
+        actual_min = stats["actual_min"]
+        actual_max = stats["actual_max"]
         
-        # Get min and max values
-        if filtered_df.count() == 0:
-            self.logger.warning(f"No non-null values in column {column}")
-            return {
-                "check_type": "value_range",
-                "column": column,
-                "min_value": min_value,
-                "max_value": max_value,
-                "actual_min": None,
-                "actual_max": None,
-                "passed": True,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
-        
-        stats = filtered_df.agg({"*": "count", column: "min", column: "max"}).collect()[0]
-        actual_min = stats[f"min({column})"]
-        actual_max = stats[f"max({column})"]
+        return self._value_range_result(
+            column, min_value, max_value, non_null_count, actual_min, actual_max
+        )
+    
+    def _value_range_result(
+        self,
+        column: str,
+        min_value: Optional[Union[int, float]],
+        max_value: Optional[Union[int, float]],
+        non_null_count: int,
+        actual_min: Any,
+        actual_max: Any
+    ) -> Dict[str, Any]:
+        """
+        Build the result of a value range check from its computed statistics.
         
-        # Check if values are within range
-        min_check = True if min_value is None else actual_min >= min_value
-        max_check = True if max_value is None else actual_max <= max_value
-        passed = min_check and max_check
+        Args:
+            column: Column name that was checked
+            min_value: Minimum allowed value
+            max_value: Maximum allowed value
+            non_null_count: Number of non-null values in the column
+            actual_min: Smallest non-null value in the column
+            actual_max: Largest non-null value in the column
+            
+        Returns:
+            Dict containing check results
+        """
+        if non_null_count == 0:
+            self.logger.warning(f"No non-null values in column {column}")
+            actual_min = None
+            actual_max = None
+            passed = True
+        else:
+            # Check if values are within range
+            min_check = True if min_value is None else actual_min >= min_value
+            max_check = True if max_value is None else actual_max <= max_value
+            passed = min_check and max_check
         
         result = {
             "check_type": "value_range",
@@ -248,16 +624,26 @@ class DataQualityMonitor:
             "actual_min": actual_min,
             "actual_max": actual_max,
             "passed": passed,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": self._check_timestamp()
         }
         
         self.logger.info(f"Value range check result: {result}")
         return result
     
-    def run_pattern_check(self, df: DataFrame, column: str, pattern: str) -> Dict[str, Any]:
+    def run_pattern_check(
+        self,
+        df: DataFrame,
+        column: str,
+        pattern: str
+    ) -> Dict[str, Any]:
         """
         Check if values in a column match the specified regex pattern.
         
+        Patterns are evaluated with Java regex on the executors. Anchored
+        patterns built from character classes (e.g. "^[A-Z]{2}[0-9]{6}$") match
+        without backtracking; avoid nested quantifiers such as "(a+)+", which
+        can backtrack exponentially on long values.
+        
         Args:
             df: Spark DataFrame to check
             column: Column name to check
@@ -268,27 +654,70 @@ class DataQualityMonitor:
         """
         self.logger.info(f"Running pattern check on column {column}")
         
-        # Filter out null values
-        filtered_df = df.filter(col(column).isNotNull())
+        # Count non-null values and matches in a single aggregation; rlike is
+        # null for null values, so they never count as matches
+        stats = df.agg(
+            count(col(column)).alias("non_null_count"),
+            sum(when(col(column).rlike(pattern), 1).otherwise(0)).alias("match_count")
+        ).first()
+        non_null_count = stats["non_null_count"]
+        match_count = stats["match_count"] or 0
         
-        if filtered_df.count() == 0:
-            self.logger.warning(f"No non-null values in column {column}")
-            return {
-                "check_type": "pattern",
-                "column": column,
-                "pattern": pattern,
-                "match_count": 0,
-                "total_count": 0,
-                "match_percentage": 0,
-                "passed": True,
-                "timestamp": datetime.datetime.now().isoformat()
-            }
+        return self._pattern_result(column, pattern, match_count, non_null_count)
+    
+    def _is_valid_pattern(self, pattern: Optional[str]) -> bool:
+        """
+        Check whether a pattern compiles as a Java regular expression.
         
-        # Count matches
-        total_count = filtered_df.count()
-        match_count = filtered_df.filter(col(column).rlike(pattern)).count()
-        match_percentage = (match_count / total_count) * 100
-        passed = match_count == total_count
+        Spark evaluates patterns with java.util.regex, whose syntax differs
+        from Python's (e.g. \\p{L} and \\z are Java only, (?P<name>...) is
+        Python only), so patterns are compiled on the driver's JVM.
+        
+        Args:
+            pattern: Regex pattern to validate
+            
+        Returns:
+            bool: True if the pattern compiles
+        """
+        if not isinstance(pattern, str):
+            return False
+        try:
+            self.spark._jvm.java.util.regex.Pattern.compile(pattern)
+        except (IllegalArgumentException, Py4JJavaError):
+            # PySpark converts the JVM's PatternSyntaxException to its own
+            # IllegalArgumentException; py4j raises Py4JJavaError otherwise
+            return False
+        return True
+    
+    def _pattern_result(
+        self,
+        column: str,
+        pattern: str,
+        match_count: int,
+        total_count: int,
+        sample_fraction: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the result of a pattern check from its computed counts.
+        
+        Args:
+            column: Column name that was checked
+            pattern: Regex pattern that was matched
+            match_count: Number of non-null values matching the pattern
+            total_count: Number of non-null values in the column
+            sample_fraction: Fraction of rows sampled, if the counts were
+                estimated from a sample
+            
+        Returns:
+            Dict containing check results
+        """
+        if total_count == 0:
+            self.logger.warning(f"No non-null values in column {column}")
+            match_percentage = 0
+            passed = True
+        else:
+            match_percentage = (match_count / total_count) * 100
+            passed = match_count == total_count
         
         result = {
             "check_type": "pattern",
@@ -298,8 +727,10 @@ class DataQualityMonitor:
             "total_count": total_count,
             "match_percentage": match_percentage,
             "passed": passed,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": self._check_timestamp()
         }
+        if sample_fraction is not None:
+            result["sample_fraction"] = sample_fraction
         
         self.logger.info(f"Pattern check result: {result}")
         return result
@@ -310,7 +741,9 @@ class DataQualityMonitor:
         column: str, 
         ref_database: str, 
         ref_table: str, 
-        ref_column: str
+        ref_column: str,
+        non_null_count: Optional[int] = None,
+        broadcast_ref: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
         Check if values in a column exist in a reference table.
@@ -321,15 +754,22 @@ class DataQualityMonitor:
             ref_database: Reference database name
             ref_table: Reference table name
             ref_column: Reference column name
+            non_null_count: Number of non-null values in the column if already
+                known, to avoid recounting
+            broadcast_ref: Join strategy for the reference values. True forces
+                a broadcast join, which avoids shuffling the checked table but
+                ships every reference value to each executor; False forces a
+                sort-merge join; None leaves the choice to Spark, which
+                broadcasts below spark.sql.autoBroadcastJoinThreshold
             
         Returns:
             Dict containing check results
         """
         self.logger.info(f"Running referential integrity check on column {column}")
         
-        # Load reference table
+        # Load reference values
         try:
-            ref_df = self.spark.table(f"{ref_database}.{ref_table}")
+            ref_values = self._load_reference_values(ref_database, ref_table, ref_column)
         except Exception as e:
             self.logger.error(f"Error loading reference table: {str(e)}")
             return {
@@ -343,13 +783,49 @@ class DataQualityMonitor:
                 "valid_percentage": None,
                 "passed": False,
                 "error": str(e),
-                "timestamp": datetime.datetime.now().isoformat()
+                "timestamp": self._check_timestamp()
             }
         
-        # Filter out null values
-        filtered_df = df.filter(col(column).isNotNull())
+        total_count = 0
+        invalid_count = 0
+        if non_null_count != 0:
+            if broadcast_ref is None:
+                broadcast = self._fits_in_broadcast(ref_values)
+            elif broadcast_ref:
+                broadcast = True
+                ref_values = F.broadcast(ref_values)
+            else:
+                broadcast = False
+                ref_values = ref_values.hint("merge")
+            
+            # Reuse the run's cached value counts of the column, if any
+            source_values = self._value_counts_cache.get(column)
+            if source_values is None and broadcast:
+                # Each row is looked up map-side against the broadcast values
+                source_values = df.filter(col(column).isNotNull()) \
+                    .select(column) \
+                    .withColumn(ROW_COUNT_COLUMN, lit(1))
+            elif source_values is None:
+                # Collapse the source to one row per distinct value before the
+                # shuffle join, so only distinct values cross the network
+                source_values = self._value_counts(df, column)
+            
+            # Left join against the distinct reference values; rows without a
+            # match are invalid. Both counts come out of a single job.
+            stats = source_values.join(
+                ref_values,
+                col(column) == col(REF_VALUE_COLUMN),
+                "left"
+            ).agg(
+                sum(ROW_COUNT_COLUMN).alias("total_count"),
+                sum(
+                    when(col(REF_VALUE_COLUMN).isNull(), col(ROW_COUNT_COLUMN)).otherwise(0)
+                ).alias("invalid_count")
+            ).first()
+            total_count = stats["total_count"] or 0
+            invalid_count = stats["invalid_count"] or 0
         
-        if filtered_df.count() == 0:
+        if total_count == 0:
             self.logger.warning(f"No non-null values in column {column}")
             return {
                 "check_type": "referential_integrity",
@@ -361,23 +837,9 @@ class DataQualityMonitor:
                 "total_count": 0,
                 "valid_percentage": 100,
                 "passed": True,
-                "timestamp": datetime.datetime.now().isoformat()
+                "timestamp": self._check_timestamp()
             }
         
-        # Get distinct values from both tables
-        source_values = filtered_df.select(column).distinct()
-        ref_values = ref_df.select(ref_column).distinct()
-        
-        # Find values that don't exist in reference table
-        invalid_values = source_values.join(
-            ref_values,
-            source_values[column] == ref_values[ref_column],
-            "left_anti"
-        )
-        
-        # Count invalid values
-        total_count = filtered_df.count()
-        invalid_count = invalid_values.count()
         valid_percentage = ((total_count - invalid_count) / total_count) * 100
         passed = invalid_count == 0
         
@@ -391,86 +853,503 @@ class DataQualityMonitor:
             "total_count": total_count,
             "valid_percentage": valid_percentage,
             "passed": passed,
-            "timestamp": datetime.datetime.now().isoformat()
+            "timestamp": self._check_timestamp()
         }
         
         self.logger.info(f"Referential integrity check result: {result}")
         return result
     
+    @staticmethod
+    def _value_counts(df: DataFrame, column: str) -> DataFrame:
+        """
+        Count the rows holding each non-null value of a column.
+        
+        Args:
+            df: Spark DataFrame containing the column
+            column: Column name to count values of
+            
+        Returns:
+            DataFrame: One row per distinct non-null value, with its row count
+                in a column named ROW_COUNT_COLUMN
+        """
+        return df.filter(col(column).isNotNull()) \
+            .groupBy(column) \
+            .agg(count("*").alias(ROW_COUNT_COLUMN))
+    
+    def _fits_in_broadcast(self, ref_values: DataFrame) -> bool:
+        """
+        Predict whether Spark will broadcast reference values on its own.
+        
+        Spark broadcasts a join side whose estimated size is within the
+        session's spark.sql.autoBroadcastJoinThreshold; the same test decides
+        whether the checked column is pre-aggregated for a shuffle join.
+        
+        Args:
+            ref_values: Spark DataFrame holding the reference values
+            
+        Returns:
+            bool: True if the estimated size is within the broadcast threshold;
+                False if it is not, or if no estimate is available
+        """
+        try:
+            threshold = self.spark._jsparkSession.sessionState().conf().autoBroadcastJoinThreshold()
+            stats = ref_values._jdf.queryExecution().optimizedPlan().stats()
+            size_in_bytes = int(stats.sizeInBytes().toString())
+        except Exception as e:
+            self.logger.debug(f"Could not estimate reference table size: {str(e)}")
+            return False
+        
+        return size_in_bytes <= threshold
+    
+    def _load_reference_values(self, ref_database: str, ref_table: str, ref_column: str) -> DataFrame:
+        """
+        Load the distinct values of a reference column.
+        
+        Values of columns that several rules in the current run check against
+        are persisted and reused; others are read fresh for each rule.
+        
+        Args:
+            ref_database: Reference database name
+            ref_table: Reference table name
+            ref_column: Reference column name
+            
+        Returns:
+            DataFrame: Spark DataFrame with one row per distinct reference value,
+                in a column named REF_VALUE_COLUMN
+        """
+        key = (ref_database, ref_table, ref_column)
+        with self._ref_values_lock:
+            if key in self._ref_values:
+                return self._ref_values[key]
+            
+            ref_values = self.spark.table(f"{ref_database}.{ref_table}") \
+                .select(col(ref_column).alias(REF_VALUE_COLUMN)) \
+                .distinct()
+            if key in self._shared_ref_keys:
+                ref_values = ref_values.persist(StorageLevel.MEMORY_AND_DISK)
+                self._ref_values[key] = ref_values
+            return ref_values
+    
+    def _release_cached_data(self) -> None:
+        """
+        Unpersist reference values and value counts cached during a run.
+        """
+        for ref_values in self._ref_values.values():
+            ref_values.unpersist()
+        self._ref_values = {}
+        self._shared_ref_keys = set()
+        
+        for value_counts in self._value_counts_cache.values():
+            value_counts.unpersist()
+        self._value_counts_cache = {}
+    
+    def _build_aggregations(
+        self,
+        df: DataFrame,
+        rules: List[Dict[str, Any]]
+    ) -> Dict[tuple, Column]:
+        """
+        Build the aggregate expressions needed to evaluate the given rules.
+        
+        Expressions are keyed by the metric they compute, so rules that need the
+        same metric (e.g. the non-null count of a column) share one expression.
+        Metrics that can be sampled end their key with the rule's sample
+        fraction (None when unsampled) and only count rows whose
+        SAMPLE_COLUMN value falls below it. Invalid rules would fail the
+        whole fused job, so they are left out and report their own error.
+        
+        Args:
+            df: Spark DataFrame the aggregations will run on
+            rules: Rules to build aggregations for
+            
+        Returns:
+            Dict mapping metric keys to aggregate column expressions
+        """
+        def count_where(predicate: Column, fraction: Optional[float]) -> Column:
+            if fraction is not None:
+                predicate = (col(SAMPLE_COLUMN) < fraction) & predicate
+            return sum(when(predicate, 1).otherwise(0))
+        
+        columns = df.columns
+        aggregations = {}
+        for rule in rules:
+            if self._rule_error(rule, columns) is not None:
+                continue
+            
+            check_type = rule.get("check_type")
+            column = rule.get("column")
+            fraction = self._sample_fraction(rule)
+            
+            if check_type in FUSIBLE_CHECK_TYPES:
+                aggregations[("rows", fraction)] = (
+                    count("*") if fraction is None else count_where(lit(True), fraction)
+                )
+            
+            if check_type == "completeness":
+                aggregations[("null", column)] = count_where(
+                    self._null_predicate(df, column), None
+                )
+            
+            elif check_type == "uniqueness":
+                aggregations[("non_null", column, None)] = count(col(column))
+                if rule.get("approximate", False):
+                    rsd = rule.get("rsd", 0.02)
+                    aggregations[("approx_distinct", column, rsd)] = F.approx_count_distinct(
+                        col(column), rsd=rsd
+                    )
+                else:
+                    aggregations[("distinct", column)] = F.countDistinct(col(column))
+            
+            elif check_type == "value_range":
+                aggregations[("non_null", column, None)] = count(col(column))
+                aggregations[("min", column)] = F.min(col(column))
+                aggregations[("max", column)] = F.max(col(column))
+            
+            elif check_type == "pattern":
+                pattern = rule.get("pattern")
+                aggregations[("non_null", column, fraction)] = count_where(
+                    col(column).isNotNull(), fraction
+                )
+                aggregations[("match", column, pattern, fraction)] = count_where(
+                    col(column).rlike(pattern), fraction
+                )
+            
+            elif check_type == "referential_integrity":
+                # The join itself cannot be fused, but its non-null count can
+                aggregations[("non_null", column, None)] = count(col(column))
+        
+        return aggregations
+    
+    def _run_fused_aggregations(self, df: DataFrame) -> Optional[Dict[tuple, Any]]:
+        """
+        Compute the aggregate metrics needed by all rules in a single Spark job.
+        
+        Sampled rules share the same scan: each row is given a uniform random
+        value once, and a rule sampling fraction f only counts rows whose value
+        is below f. The sample condition comes first in each predicate, so the
+        regex match is skipped for other rows; every row is still read.
+        
+        Args:
+            df: Spark DataFrame to check
+            
+        Returns:
+            Dict mapping metric keys to their values, or None if the fused
+            aggregation failed and checks should run individually
+        """
+        try:
+            aggregations = self._build_aggregations(df, self.rules)
+            if not aggregations:
+                return {}
+            
+            if any(self._sample_fraction(rule) is not None for rule in self.rules):
+                df = df.withColumn(SAMPLE_COLUMN, F.rand(SAMPLE_SEED))
+            
+            keys = list(aggregations)
+            self.logger.info(
+                f"Computing {len(keys)} aggregations for {len(self.rules)} rules in a single pass"
+            )
+            row = df.agg(*[aggregations[key].alias(f"agg_{i}") for i, key in enumerate(keys)]).first()
+        except Exception as e:
+            self.logger.warning(f"Fused aggregation failed, running checks individually: {str(e)}")
+            return None
+        
+        return {key: row[f"agg_{i}"] for i, key in enumerate(keys)}
+    
+    def _sample_fraction(self, rule: Dict[str, Any]) -> Optional[float]:
+        """
+        Get the fraction of rows a rule should be evaluated on.
+        
+        Rules may set "sample_fraction" or "sample_rows". Sampling only
+        applies to check types in SAMPLED_CHECK_TYPES, and only when the
+        expected sample has at least MIN_SAMPLE_ROWS rows. Every row has the
+        same chance of being sampled; stratified sampling with per-stratum
+        fractions (as in DataFrame.sampleBy) is not supported.
+        
+        Args:
+            rule: Rule to get the sample fraction for
+            
+        Returns:
+            float: Fraction of rows to sample, or None to check every row
+        """
+        if rule.get("check_type") not in SAMPLED_CHECK_TYPES or not self._total_count:
+            return None
+        
+        fraction = rule.get("sample_fraction")
+        if fraction is None and _is_number(rule.get("sample_rows")):
+            fraction = rule["sample_rows"] / self._total_count
+        
+        if not _is_number(fraction) or fraction >= 1 or self._total_count * fraction < MIN_SAMPLE_ROWS:
+            return None
+        return fraction
+    
+    def _fused_result(self, rule: Dict[str, Any], aggregates: Dict[tuple, Any]) -> Dict[str, Any]:
+        """
+        Build the result of a fusible rule from precomputed aggregates.
+        
+        Args:
+            rule: Rule to evaluate
+            aggregates: Metric values computed by _run_fused_aggregations
+            
+        Returns:
+            Dict containing check results
+        """
+        check_type = rule.get("check_type")
+        column = rule.get("column")
+        total_count = self._total_count
+        
+        # Counts from a sample are scaled up to estimates for the whole table
+        sample_fraction = self._sample_fraction(rule)
+        scale = 1
+        if sample_fraction is not None and aggregates[("rows", sample_fraction)]:
+            scale = total_count / aggregates[("rows", sample_fraction)]
+        
+        if check_type == "completeness":
+            null_count = aggregates[("null", column)] or 0
+            return self._completeness_result(
+                column, rule.get("threshold", 0), null_count, total_count
+            )
+        
+        non_null_count = round((aggregates[("non_null", column, sample_fraction)] or 0) * scale)
+        
+        if check_type == "uniqueness":
+            approximate = rule.get("approximate", False)
+            if approximate:
+                unique_count = aggregates[("approx_distinct", column, rule.get("rsd", 0.02))]
+            else:
+                unique_count = aggregates[("distinct", column)]
+            # Distinct aggregates ignore nulls, whereas a distinct scan counts null as a value
+            if non_null_count < total_count:
+                unique_count += 1
+            return self._uniqueness_result(
+                column, rule.get("threshold", 100), unique_count, total_count, approximate
+            )
+        
+        if check_type == "value_range":
+            return self._value_range_result(
+                column,
+                rule.get("min_value"),
+                rule.get("max_value"),
+                non_null_count,
+                aggregates[("min", column)],
+                aggregates[("max", column)]
+            )
+        
+        pattern = rule.get("pattern")
+        match_count = round((aggregates[("match", column, pattern, sample_fraction)] or 0) * scale)
+        return self._pattern_result(column, pattern, match_count, non_null_count, sample_fraction)
+    
+    def _rule_error(self, rule: Dict[str, Any], columns: List[str]) -> Optional[str]:
+        """
+        Check a rule's settings before any Spark job is built from them.
+        
+        Args:
+            rule: Rule to validate
+            columns: Columns of the table being checked
+            
+        Returns:
+            str: Description of the first problem found, or None if the rule
+                is valid
+        """
+        column = rule.get("column")
+        if not isinstance(column, str) or not column:
+            return f"Rule {rule.get('rule_id')} does not name a column"
+        if self._top_level_column(column).lower() not in {c.lower() for c in columns}:
+            return f"Column {column} not found in {self.database_name}.{self.table_name}"
+        
+        for field in ("sample_fraction", "sample_rows", "rsd"):
+            value = rule.get(field)
+            if value is not None and not _is_number(value):
+                return f"Invalid {field} for column {column}: {value!r}"
+        
+        rsd = rule.get("rsd")
+        if rsd is not None and not 0 < rsd <= MAX_APPROX_RSD:
+            return f"rsd for column {column} must be above 0 and at most {MAX_APPROX_RSD}: {rsd!r}"
+        
+        if rule.get("check_type") == "pattern" and not self._is_valid_pattern(rule.get("pattern")):
+            return f"Invalid pattern for column {column}: {rule.get('pattern')!r}"
+        
+        return None
+    
+    def _run_rule(
+        self,
+        df: DataFrame,
+        rule: Dict[str, Any],
+        aggregates: Optional[Dict[tuple, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Run a single data quality rule and publish its metrics and alerts.
+        
+        Args:
+            df: Spark DataFrame to check
+            rule: Rule to run
+            aggregates: Metric values computed by _run_fused_aggregations, or
+                None if checks must run individually
+            
+        Returns:
+            Dict containing check results, or None for unknown check types
+        """
+        # Run this thread's Spark jobs in the monitor's scheduler pool so
+        # concurrent checks share executors fairly
+        self.spark.sparkContext.setLocalProperty("spark.scheduler.pool", SCHEDULER_POOL)
+        
+        try:
+            check_type = rule.get("check_type")
+            column = rule.get("column")
+            
+            if check_type in CHECK_TYPES:
+                error = self._rule_error(rule, df.columns)
+                if error is not None:
+                    raise ValueError(error)
+            
+            if aggregates is not None and check_type in FUSIBLE_CHECK_TYPES:
+                result = self._fused_result(rule, aggregates)
+            
+            elif check_type == "completeness":
+                threshold = rule.get("threshold", 0)
+                result = self.run_completeness_check(
+                    df, column, threshold, total_count=self._total_count
+                )
+            
+            elif check_type == "uniqueness":
+                threshold = rule.get("threshold", 100)
+                approximate = rule.get("approximate", False)
+                rsd = rule.get("rsd", 0.02)
+                result = self.run_uniqueness_check(
+                    df, column, threshold, approximate, rsd, total_count=self._total_count
+                )
+            
+            elif check_type == "value_range":
+                min_value = rule.get("min_value")
+                max_value = rule.get("max_value")
+                result = self.run_value_range_check(df, column, min_value, max_value)
+            
+            elif check_type == "pattern":
+                pattern = rule.get("pattern")
+                result = self.run_pattern_check(df, column, pattern)
+            
+            elif check_type == "referential_integrity":
+                ref_database = rule.get("ref_database")
+                ref_table = rule.get("ref_table")
+                ref_column = rule.get("ref_column")
+                broadcast_ref = rule.get("broadcast_ref")
+                result = self.run_referential_integrity_check(
+                    df, column, ref_database, ref_table, ref_column,
+                    non_null_count=(aggregates or {}).get(("non_null", column, None)),
+                    broadcast_ref=broadcast_ref
+                )
+            
+            else:
+                self.logger.warning(f"Unknown check type: {check_type}")
+                return None
+            
+            # Add rule metadata to result
+            result["rule_id"] = rule.get("rule_id")
+            result["rule_name"] = rule.get("rule_name")
+            result["rule_description"] = rule.get("rule_description")
+            result["severity"] = rule.get("severity", "medium")
+            
+            # Queue metrics for CloudWatch
+            self.send_metrics_to_cloudwatch(result)
+            
+            # Send alert if check failed
+            if not result["passed"] and rule.get("alert", False):
+                self.send_alert(result)
+            
+            return result
+        
+        except Exception as e:
+            self.logger.error(f"Error running check: {str(e)}")
+            return {
+                "rule_id": rule.get("rule_id"),
+                "rule_name": rule.get("rule_name"),
+                "check_type": rule.get("check_type"),
+                "column": rule.get("column"),
+                "passed": False,
+                "error": str(e),
+                "timestamp": self._check_timestamp()
+            }
+    
     def run_all_checks(self) -> List[Dict[str, Any]]:
         """
         Run all data quality checks defined in the rules.
         
+        Rules run concurrently on a thread pool so that checks which need
+        their own Spark jobs can share the cluster; results keep rule order.
+        Their jobs are submitted to the SCHEDULER_POOL pool, which only shares
+        executors between them when the application is started with
+        spark.scheduler.mode=FAIR; with the default FIFO mode each job waits
+        for the ones submitted before it.
+        Pattern rules with a sample_fraction or sample_rows only match a
+        random sample of rows against their regex and report estimated counts.
+        
         Returns:
             List of dictionaries containing check results
         """
         self.logger.info("Running all data quality checks")
         
-        # Load data
+        # Load data and keep the columns the rules check cached, so every
+        # check reuses a single scan without caching unused columns
         df = self.load_data()
+        df = df.select(*[col(self._quote_column(c)) for c in self._referenced_columns(df.columns)])
+        df = df.persist(StorageLevel.MEMORY_AND_DISK)
         
-        # Run checks
-        results = []
-        for rule in self.rules:
-            try:
-                check_type = rule.get("check_type")
-                column = rule.get("column")
-                
-                if check_type == "completeness":
-                    threshold = rule.get("threshold", 0)
-                    result = self.run_completeness_check(df, column, threshold)
-                
-                elif check_type == "uniqueness":
-                    threshold = rule.get("threshold", 100)
-                    result = self.run_uniqueness_check(df, column, threshold)
-                
-                elif check_type == "value_range":
-                    min_value = rule.get("min_value")
-                    max_value = rule.get("max_value")
-                    result = self.run_value_range_check(df, column, min_value, max_value)
-                
-                elif check_type == "pattern":
-                    pattern = rule.get("pattern")
-                    result = self.run_pattern_check(df, column, pattern)
-                
-                elif check_type == "referential_integrity":
-                    ref_database = rule.get("ref_database")
-                    ref_table = rule.get("ref_table")
-                    ref_column = rule.get("ref_column")
-                    result = self.run_referential_integrity_check(
-                        df, column, ref_database, ref_table, ref_column
-                    )
-                
-                else:
-                    self.logger.warning(f"Unknown check type: {check_type}")
-                    continue
-                
-                # Add rule metadata to result
-                result["rule_id"] = rule.get("rule_id")
-                result["rule_name"] = rule.get("rule_name")
-                result["rule_description"] = rule.get("rule_description")
-                result["severity"] = rule.get("severity", "medium")
-                
-                results.append(result)
-                
-                # Send metrics to CloudWatch
-                self.send_metrics_to_cloudwatch(result)
-                
-                # Send alert if check failed
-                if not result["passed"] and rule.get("alert", False):
-                    self.send_alert(result)
-                
-            except Exception as e:
-                self.logger.error(f"Error running check: {str(e)}")
-                results.append({
-                    "rule_id": rule.get("rule_id"),
-                    "rule_name": rule.get("rule_name"),
-                    "check_type": rule.get("check_type"),
-                    "column": rule.get("column"),
-                    "passed": False,
-                    "error": str(e),
-                    "timestamp": datetime.datetime.now().isoformat()
-                })
+        # Reference values that several rules check against are loaded once
+        ref_keys = Counter(
+            (rule.get("ref_database"), rule.get("ref_table"), rule.get("ref_column"))
+            for rule in self.rules
+            if rule.get("check_type") == "referential_integrity"
+        )
+        self._shared_ref_keys = {key for key, rule_count in ref_keys.items() if rule_count > 1}
+        
+        try:
+            self._run_timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+            self._total_count = df.count()
+            self.logger.info(f"Loaded {self._total_count} rows")
+            
+            # Compute the metrics of all fusible checks, sampled or not, in one job
+            aggregates = self._run_fused_aggregations(df)
+            
+            # Cache the value counts of columns that several referential
+            # integrity rules join on, so the source is grouped once per column
+            ref_columns = Counter(
+                rule.get("column") for rule in self.rules
+                if rule.get("check_type") == "referential_integrity"
+                and self._rule_error(rule, df.columns) is None
+            )
+            for column, rule_count in ref_columns.items():
+                if rule_count > 1:
+                    self._value_counts_cache[column] = self._value_counts(df, column) \
+                        .persist(StorageLevel.MEMORY_AND_DISK)
+            
+            if min(self.max_workers, len(self.rules)) > 1 and self._scheduler_mode() != "FAIR":
+                self.logger.warning(
+                    "spark.scheduler.mode is not FAIR, so concurrent checks will "
+                    "queue behind each other's jobs"
+                )
+            
+            # Run checks
+            rule_results: List[Optional[Dict[str, Any]]] = [None] * len(self.rules)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self._run_rule, df, rule, aggregates): i
+                    for i, rule in enumerate(self.rules)
+                }
+                for future in as_completed(futures):
+                    rule_results[futures[future]] = future.result()
+        
+        finally:
+            df.unpersist()
+            self._release_cached_data()
+            self._total_count = None
+            self._run_timestamp = None
+        
+        results = [result for result in rule_results if result is not None]
+        
+        # Send the metrics of all checks to CloudWatch
+        self.flush_metrics()
+        
+        # Wait for alerts of failed checks to be published
+        self.flush_alerts()
         
         # Save results if metrics path is provided
         if self.metrics_path:
@@ -478,9 +1357,21 @@ class DataQualityMonitor:
         
         return results
     
+    def _scheduler_mode(self) -> str:
+        """
+        Get the Spark application's job scheduling mode.
+        
+        Returns:
+            str: "FAIR" or "FIFO"
+        """
+        return self.spark.sparkContext.getConf().get("spark.scheduler.mode", "FIFO").upper()
+    
     def send_metrics_to_cloudwatch(self, result: Dict[str, Any]) -> None:
         """
-        Send data quality metrics to CloudWatch.
+        Queue data quality metrics for CloudWatch.
+        
+        Metrics are buffered and sent in batches by flush_metrics, which
+        run_all_checks calls once all checks have finished.
         
         Args:
             result: Check result to send as metrics
@@ -495,40 +1386,21 @@ class DataQualityMonitor:
                 {"Name": "Column", "Value": result.get("column", "unknown")}
             ]
             
-            # Add check-specific metrics
+            # Add check-specific metrics; errored checks have no percentage to
+            # report, and a None value would fail the whole PutMetricData batch
             check_type = result.get("check_type")
+            percentage_metric = PERCENTAGE_METRICS.get(check_type)
             
-            if check_type == "completeness":
-                metric_data.append({
-                    "MetricName": "NullPercentage",
-                    "Dimensions": dimensions,
-                    "Value": result.get("null_percentage", 0),
-                    "Unit": "Percent"
-                })
-            
-            elif check_type == "uniqueness":
-                metric_data.append({
-                    "MetricName": "UniquePercentage",
-                    "Dimensions": dimensions,
-                    "Value": result.get("unique_percentage", 0),
-                    "Unit": "Percent"
-                })
-            
-            elif check_type == "pattern":
-                metric_data.append({
-                    "MetricName": "PatternMatchPercentage",
-                    "Dimensions": dimensions,
-                    "Value": result.get("match_percentage", 0),
-                    "Unit": "Percent"
-                })
-            
-            elif check_type == "referential_integrity":
-                metric_data.append({
-                    "MetricName": "ReferentialIntegrityPercentage",
-                    "Dimensions": dimensions,
-                    "Value": result.get("valid_percentage", 0),
-                    "Unit": "Percent"
-                })
+            if percentage_metric is not None:
+                metric_name, field = percentage_metric
+                value = result.get(field)
+                if value is not None:
+                    metric_data.append({
+                        "MetricName": metric_name,
+                        "Dimensions": dimensions,
+                        "Value": value,
+                        "Unit": "Percent"
+                    })
             
             # Add pass/fail metric
             metric_data.append({
@@ -538,21 +1410,145 @@ class DataQualityMonitor:
                 "Unit": "Count"
             })
             
-            # Send metrics to CloudWatch
-            if metric_data:
+            # Queue metrics for the next flush
+            with self._pending_metrics_lock:
+                self._pending_metrics.extend(metric_data)
+        
+        except Exception as e:
+            self.logger.error(f"Error sending metrics to CloudWatch: {str(e)}")
+    
+    def flush_metrics(self) -> None:
+        """
+        Send all queued metrics to CloudWatch in as few calls as possible.
+        """
+        with self._pending_metrics_lock:
+            pending_metrics = self._pending_metrics
+            self._pending_metrics = []
+        
+        try:
+            metric_data = self._aggregate_metrics(pending_metrics)
+        except Exception as e:
+            self.logger.error(f"Error aggregating metrics for CloudWatch: {str(e)}")
+            return
+        
+        for start in range(0, len(metric_data), CLOUDWATCH_MAX_METRICS_PER_REQUEST):
+            batch = metric_data[start:start + CLOUDWATCH_MAX_METRICS_PER_REQUEST]
+            try:
                 self.cloudwatch_client.put_metric_data(
                     Namespace="DataQuality",
-                    MetricData=metric_data
+                    MetricData=batch
                 )
-                self.logger.info(f"Sent {len(metric_data)} metrics to CloudWatch")
+                self.logger.info(f"Sent {len(batch)} metrics to CloudWatch")
+            
+            except Exception as e:
+                self.logger.error(f"Error sending metrics to CloudWatch: {str(e)}")
+    
+    @staticmethod
+    def _aggregate_metrics(metric_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Collapse metrics that share a name, dimensions and unit into one datum.
         
-        except Exception as e:
-            self.logger.error(f"Error sending metrics to CloudWatch: {str(e)}")
+        Repeated metrics (e.g. two pattern rules on the same column) are sent
+        as a single StatisticSet instead of one value each, which keeps
+        PutMetricData payloads small. All metrics use standard resolution.
+        Metrics without a finite numeric value are dropped, since CloudWatch
+        would reject the whole request over them.
+        
+        Args:
+            metric_data: Metrics queued by send_metrics_to_cloudwatch
+            
+        Returns:
+            List of metric data entries ready for PutMetricData
+        """
+        grouped: Dict[tuple, Dict[str, Any]] = {}
+        for metric in metric_data:
+            value = metric.get("Value")
+            if not _is_number(value) or not math.isfinite(value):
+                continue
+            key = (
+                metric["MetricName"],
+                tuple((d["Name"], d["Value"]) for d in metric["Dimensions"]),
+                metric["Unit"]
+            )
+            grouped.setdefault(key, {"metric": metric, "values": []})["values"].append(value)
+        
+        aggregated = []
+        for group in grouped.values():
+            metric = group["metric"]
+            values = group["values"]
+            entry = {
+                "MetricName": metric["MetricName"],
+                "Dimensions": metric["Dimensions"],
+                "Unit": metric["Unit"],
+                "StorageResolution": 60
+            }
+            if len(values) == 1:
+                entry["Value"] = values[0]
+            else:
+                entry["StatisticValues"] = {
+                    "SampleCount": len(values),
+                    "Sum": math.fsum(values),
+                    "Minimum": min(values),
+                    "Maximum": max(values)
+                }
+            aggregated.append(entry)
+        
+        return aggregated
     
     def send_alert(self, result: Dict[str, Any]) -> None:
         """
         Send an alert for a failed data quality check.
         
+        The alert is published to SNS by a background thread so that slow
+        publishes do not hold up the checks; call flush_alerts to wait for
+        queued alerts to be sent and stop the thread.
+        
+        Args:
+            result: Check result to send an alert for
+        """
+        with self._alert_thread_lock:
+            if self._alert_thread is None:
+                self._alert_queue = queue.Queue()
+                self._alert_thread = threading.Thread(
+                    target=self._alert_worker,
+                    args=(self._alert_queue,),
+                    name="DataQualityAlerts",
+                    daemon=True
+                )
+                self._alert_thread.start()
+            self._alert_queue.put(result)
+    
+    def flush_alerts(self) -> None:
+        """
+        Block until every queued alert has been published, then stop the
+        background thread. A later alert starts a new one.
+        """
+        with self._alert_thread_lock:
+            alert_queue, alert_thread = self._alert_queue, self._alert_thread
+            self._alert_queue, self._alert_thread = None, None
+        
+        if alert_thread is None:
+            return
+        alert_queue.put(None)
+        alert_thread.join()
+    
+    def _alert_worker(self, alert_queue: queue.Queue) -> None:
+        """
+        Publish queued alerts until the None sentinel queued by flush_alerts.
+        
+        Args:
+            alert_queue: Queue of check results to send alerts for
+        """
+        while True:
+            result = alert_queue.get()
+            if result is None:
+                return
+            self._publish_alert(result)
+    
+    def _publish_alert(self, result: Dict[str, Any]) -> None:
+        """
+        Publish an alert for a failed data quality check to SNS.
+        
         Args:
             result: Check result to send an alert for
         """
@@ -582,7 +1578,7 @@ class DataQualityMonitor:
             self.sns_client.publish(
                 TopicArn=sns_topic_arn,
                 Subject=subject,
-                Message=json.dumps(message, indent=2)
+                Message=_dumps(message, indent=True).decode("utf-8")
             )
             
             self.logger.info(f"Sent alert to SNS topic: {sns_topic_arn}")
@@ -594,27 +1590,81 @@ class DataQualityMonitor:
         """
         Save check results to the specified path.
         
+        Local paths get a single gzipped JSON Lines file per run, with one
+        result per line. Remote URIs such as
+        s3:// are appended to as a Parquet dataset partitioned by check type,
+        so the metrics history can be queried with Athena or Glue.
+        
         Args:
             results: List of check results to save
         """
         try:
+            if urlparse(self.metrics_path).scheme:
+                self._save_results_to_dataset(results)
+                return
+            
             # Create timestamp for filename
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{self.database_name}_{self.table_name}_{timestamp}.json"
+            filename = f"{self.database_name}_{self.table_name}_{timestamp}.jsonl.gz"
             filepath = os.path.join(self.metrics_path, filename)
             
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             
             # Save results
-            with open(filepath, 'w') as f:
-                json.dump(results, f, indent=2)
+            with gzip.open(filepath, 'wb') as f:
+                for result in results:
+                    f.write(_dumps(result) + b"\n")
             
             self.logger.info(f"Saved results to {filepath}")
         
         except Exception as e:
             self.logger.error(f"Error saving results: {str(e)}")
     
+    def _save_results_to_dataset(self, results: List[Dict[str, Any]]) -> None:
+        """
+        Append check results to the Parquet dataset at the metrics path.
+        
+        Args:
+            results: List of check results to save
+        """
+        if not results:
+            self.logger.info("No results to save")
+            return
+        
+        # Write with a fixed schema so that column types do not drift between
+        # runs with whatever values this run happened to produce
+        rows = [self._results_row(result) for result in results]
+        results_df = self.spark.createDataFrame(rows, schema=RESULTS_SCHEMA)
+        
+        results_df.write.mode("append").partitionBy("check_type").parquet(self.metrics_path)
+        
+        self.logger.info(f"Saved {len(results)} results to {self.metrics_path}")
+    
+    def _results_row(self, result: Dict[str, Any]) -> tuple:
+        """
+        Convert a check result to a row of the results dataset.
+        
+        Args:
+            result: Check result to convert
+            
+        Returns:
+            tuple: Values in RESULTS_SCHEMA order; values that cannot be
+                converted to their field's type are stored as null
+        """
+        record = dict(result, database=self.database_name, table=self.table_name)
+        
+        row = []
+        for field in RESULTS_SCHEMA.fields:
+            value = record.get(field.name)
+            if value is not None:
+                try:
+                    value = RESULTS_TYPE_CONVERSIONS[field.dataType](value)
+                except (TypeError, ValueError):
+                    value = None
+            row.append(value)
+        return tuple(row)
+    
     def generate_report(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Generate a summary report from check results.
@@ -627,21 +1677,22 @@ class DataQualityMonitor:
         """
         try:
             # Count checks by type and status
-            total_checks = len(results)
-            passed_checks = sum(1 for r in results if r.get("passed", False))
+            results_df = pd.DataFrame(results, columns=["check_type", "passed"])
+            passed = results_df["passed"].eq(True)
+            
+            total_checks = len(results_df)
+            passed_checks = int(passed.sum())
             failed_checks = total_checks - passed_checks
             
-            check_types = {}
-            for result in results:
-                check_type = result.get("check_type")
-                if check_type not in check_types:
-                    check_types[check_type] = {"total": 0, "passed": 0, "failed": 0}
-                
-                check_types[check_type]["total"] += 1
-                if result.get("passed", False):
-                    check_types[check_type]["passed"] += 1
-                else:
-                    check_types[check_type]["failed"] += 1
+            counts = passed.groupby(results_df["check_type"], sort=False, dropna=False).agg(["count", "sum"])
+            check_types = {
+                (None if pd.isna(check_type) else check_type): {
+                    "total": int(row["count"]),
+                    "passed": int(row["sum"]),
+                    "failed": int(row["count"] - row["sum"])
+                }
+                for check_type, row in counts.iterrows()
+            }
             
             # Generate report
             report = {
@@ -655,7 +1706,7 @@ class DataQualityMonitor:
                     "pass_percentage": (passed_checks / total_checks * 100) if total_checks > 0 else 100
                 },
                 "by_check_type": check_types,
-                "failed_checks": [r for r in results if not r.get("passed", False)]
+                "failed_checks": [r for r, ok in zip(results, passed) if not ok]
             }
             
             self.logger.info(f"Generated report: {report['summary']}")
@@ -0,0 +1,31 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+# The framework is a plain directory of modules rather than an installed package
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "framework"))
+
+# boto3 needs a region to construct clients; no requests are made by the tests
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+
+@pytest.fixture(scope="session")
+def spark(tmp_path_factory):
+    """Local SparkSession shared by the tests that run real Spark jobs."""
+    if not (os.environ.get("JAVA_HOME") or shutil.which("java")):
+        pytest.skip("Java is required to run Spark tests")
+
+    from pyspark.sql import SparkSession
+
+    session = SparkSession.builder \
+        .master("local[2]") \
+        .appName("data-quality-tests") \
+        .config("spark.ui.enabled", "false") \
+        .config("spark.sql.shuffle.partitions", "2") \
+        .config("spark.sql.warehouse.dir", str(tmp_path_factory.mktemp("warehouse"))) \
+        .getOrCreate()
+    session.sparkContext.setLogLevel("ERROR")
+    yield session
+    session.stop()
@@ -0,0 +1,409 @@
+import datetime
+import gzip
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+from py4j.protocol import Py4JJavaError
+
+import DataQualityMonitor as dq_module
+from DataQualityMonitor import DataQualityMonitor, RESULTS_SCHEMA, _dumps
+
+
+@pytest.fixture
+def monitor():
+    return DataQualityMonitor(MagicMock(), "sales", "orders")
+
+
+def test_top_level_column():
+    assert DataQualityMonitor._top_level_column("amount") == "amount"
+    assert DataQualityMonitor._top_level_column("address.city") == "address"
+    assert DataQualityMonitor._top_level_column("`order.id`") == "order.id"
+
+
+def test_quote_column():
+    assert DataQualityMonitor._quote_column("amount") == "`amount`"
+    assert DataQualityMonitor._quote_column("order.id") == "`order.id`"
+    assert DataQualityMonitor._quote_column("odd`name") == "`odd``name`"
+
+
+def test_referenced_columns_keeps_table_order(monitor):
+    monitor.rules = [
+        {"check_type": "completeness", "column": "Status"},
+        {"check_type": "pattern", "column": "address.zip"},
+        {"check_type": "uniqueness", "column": "order_id"},
+        {"check_type": "completeness"},
+    ]
+
+    columns = monitor._referenced_columns(["order_id", "customer_id", "status", "address"])
+
+    assert columns == ["order_id", "status", "address"]
+
+
+def test_send_metrics_skips_missing_percentage(monitor):
+    monitor.send_metrics_to_cloudwatch({
+        "check_type": "referential_integrity",
+        "column": "customer_id",
+        "valid_percentage": None,
+        "passed": False,
+        "error": "Table or view not found",
+    })
+
+    assert [m["MetricName"] for m in monitor._pending_metrics] == ["CheckPassed"]
+    assert monitor._pending_metrics[0]["Value"] == 0
+
+
+def test_send_metrics_includes_percentage(monitor):
+    monitor.send_metrics_to_cloudwatch({
+        "check_type": "completeness",
+        "column": "status",
+        "null_percentage": 2.5,
+        "passed": True,
+    })
+
+    assert [(m["MetricName"], m["Value"]) for m in monitor._pending_metrics] == [
+        ("NullPercentage", 2.5),
+        ("CheckPassed", 1),
+    ]
+
+
+def _metric(name, value, column="status", unit="Percent"):
+    return {
+        "MetricName": name,
+        "Dimensions": [{"Name": "Column", "Value": column}],
+        "Value": value,
+        "Unit": unit,
+    }
+
+
+def test_aggregate_metrics_collapses_repeated_metrics():
+    aggregated = DataQualityMonitor._aggregate_metrics([
+        _metric("PatternMatchPercentage", 90.0),
+        _metric("PatternMatchPercentage", 100.0),
+        _metric("PatternMatchPercentage", 95.0, column="zip"),
+    ])
+
+    assert aggregated == [
+        {
+            "MetricName": "PatternMatchPercentage",
+            "Dimensions": [{"Name": "Column", "Value": "status"}],
+            "Unit": "Percent",
+            "StorageResolution": 60,
+            "StatisticValues": {"SampleCount": 2, "Sum": 190.0, "Minimum": 90.0, "Maximum": 100.0},
+        },
+        {
+            "MetricName": "PatternMatchPercentage",
+            "Dimensions": [{"Name": "Column", "Value": "zip"}],
+            "Unit": "Percent",
+            "StorageResolution": 60,
+            "Value": 95.0,
+        },
+    ]
+
+
+def test_aggregate_metrics_drops_non_numeric_values():
+    aggregated = DataQualityMonitor._aggregate_metrics([
+        _metric("ReferentialIntegrityPercentage", None),
+        _metric("ReferentialIntegrityPercentage", float("nan")),
+        _metric("ReferentialIntegrityPercentage", "n/a"),
+        _metric("ReferentialIntegrityPercentage", 80),
+    ])
+
+    assert len(aggregated) == 1
+    assert aggregated[0]["Value"] == 80
+
+
+def test_flush_metrics_sends_aggregated_batch(monitor):
+    monitor.cloudwatch_client = boto3.client("cloudwatch")
+    monitor.send_metrics_to_cloudwatch({
+        "check_type": "referential_integrity",
+        "column": "customer_id",
+        "valid_percentage": None,
+        "passed": False,
+    })
+    monitor.send_metrics_to_cloudwatch({
+        "check_type": "referential_integrity",
+        "column": "customer_id",
+        "valid_percentage": 100.0,
+        "passed": True,
+    })
+    dimensions = [
+        {"Name": "Database", "Value": "sales"},
+        {"Name": "Table", "Value": "orders"},
+        {"Name": "Column", "Value": "customer_id"},
+    ]
+
+    with Stubber(monitor.cloudwatch_client) as stubber:
+        stubber.add_response("put_metric_data", {}, {
+            "Namespace": "DataQuality",
+            "MetricData": [
+                {
+                    "MetricName": "CheckPassed",
+                    "Dimensions": dimensions + [{"Name": "CheckType", "Value": "referential_integrity"}],
+                    "Unit": "Count",
+                    "StorageResolution": 60,
+                    "StatisticValues": {"SampleCount": 2, "Sum": 1.0, "Minimum": 0, "Maximum": 1},
+                },
+                {
+                    "MetricName": "ReferentialIntegrityPercentage",
+                    "Dimensions": dimensions,
+                    "Unit": "Percent",
+                    "StorageResolution": 60,
+                    "Value": 100.0,
+                },
+            ],
+        })
+        monitor.flush_metrics()
+        stubber.assert_no_pending_responses()
+
+    assert monitor._pending_metrics == []
+
+
+@pytest.mark.parametrize("rule, error", [
+    ({"check_type": "completeness", "column": "status"}, None),
+    ({"check_type": "completeness", "column": "Address.zip"}, None),
+    ({"check_type": "completeness"}, "Rule r1 does not name a column"),
+    ({"check_type": "completeness", "column": "stauts"}, "Column stauts not found in sales.orders"),
+    ({"check_type": "completeness", "column": "status", "sample_fraction": "0.1"},
+     "Invalid sample_fraction for column status: '0.1'"),
+    ({"check_type": "uniqueness", "column": "status", "rsd": None}, None),
+    ({"check_type": "uniqueness", "column": "status", "rsd": True},
+     "Invalid rsd for column status: True"),
+    ({"check_type": "uniqueness", "column": "status", "rsd": 0.39}, None),
+    ({"check_type": "uniqueness", "column": "status", "rsd": 0.4},
+     "rsd for column status must be above 0 and at most 0.39: 0.4"),
+    ({"check_type": "uniqueness", "column": "status", "rsd": 0},
+     "rsd for column status must be above 0 and at most 0.39: 0"),
+])
+def test_rule_error(monitor, rule, error):
+    assert monitor._rule_error({"rule_id": "r1", **rule}, ["status", "address"]) == error
+
+
+def test_is_valid_pattern_compiles_on_jvm(monitor):
+    compile_pattern = monitor.spark._jvm.java.util.regex.Pattern.compile
+
+    assert monitor._is_valid_pattern(r"^\p{L}+\z")
+    compile_pattern.assert_called_once_with(r"^\p{L}+\z")
+
+    compile_pattern.side_effect = Py4JJavaError("PatternSyntaxException", MagicMock())
+    assert not monitor._is_valid_pattern("(?P<x>a)")
+    assert not monitor._is_valid_pattern(None)
+
+
+def test_flush_alerts_publishes_and_stops_worker(monitor, monkeypatch):
+    monkeypatch.setenv("DATA_QUALITY_ALERT_TOPIC_ARN", "arn:aws:sns:us-east-1:123456789012:dq")
+    monitor.sns_client = MagicMock()
+
+    monitor.send_alert({"rule_name": "orders_status_complete", "passed": False})
+    monitor.send_alert({"rule_name": "orders_id_unique", "passed": False})
+    worker = monitor._alert_thread
+    monitor.flush_alerts()
+
+    assert monitor.sns_client.publish.call_count == 2
+    assert not worker.is_alive()
+    assert monitor._alert_thread is None
+
+    monitor.flush_alerts()
+
+
+def test_results_row_uses_fixed_types(monitor):
+    row = monitor._results_row({
+        "rule_id": 7,
+        "check_type": "value_range",
+        "column": "order_date",
+        "min_value": "2020-01-01",
+        "max_value": None,
+        "actual_min": datetime.date(2021, 3, 4),
+        "actual_max": Decimal("19.90"),
+        "passed": True,
+        "unexpected_field": "ignored",
+    })
+    record = dict(zip(RESULTS_SCHEMA.names, row))
+
+    assert len(row) == len(RESULTS_SCHEMA.fields)
+    assert record["database"] == "sales"
+    assert record["table"] == "orders"
+    assert record["rule_id"] == "7"
+    assert record["actual_min"] == "2021-03-04"
+    assert record["actual_max"] == "19.90"
+    assert record["max_value"] is None
+    assert record["passed"] is True
+
+
+def test_results_row_stores_percentages_as_floats(monitor):
+    row = monitor._results_row({
+        "check_type": "completeness",
+        "null_count": 0,
+        "total_count": 0,
+        "null_percentage": 0,
+        "threshold": "five",
+    })
+    record = dict(zip(RESULTS_SCHEMA.names, row))
+
+    assert isinstance(record["null_percentage"], float)
+    assert record["total_count"] == 0
+    assert record["threshold"] is None
+
+
+def _ref_values(size_in_bytes):
+    ref_values = MagicMock()
+    stats = ref_values._jdf.queryExecution.return_value.optimizedPlan.return_value.stats.return_value
+    stats.sizeInBytes.return_value.toString.return_value = str(size_in_bytes)
+    return ref_values
+
+
+@pytest.mark.parametrize("threshold, size_in_bytes, fits", [
+    (10485760, 1024, True),
+    (10485760, 10485761, False),
+    (-1, 1024, False),
+])
+def test_fits_in_broadcast_uses_session_threshold(monitor, threshold, size_in_bytes, fits):
+    conf = monitor.spark._jsparkSession.sessionState.return_value.conf.return_value
+    conf.autoBroadcastJoinThreshold.return_value = threshold
+
+    assert monitor._fits_in_broadcast(_ref_values(size_in_bytes)) is fits
+
+
+def test_fits_in_broadcast_without_estimate(monitor):
+    ref_values = MagicMock()
+    ref_values._jdf.queryExecution.side_effect = RuntimeError("no plan")
+
+    assert monitor._fits_in_broadcast(ref_values) is False
+
+
+@pytest.mark.parametrize("rule, fraction", [
+    ({"check_type": "pattern", "sample_fraction": 0.1}, 0.1),
+    ({"check_type": "pattern", "sample_rows": 50000}, 0.05),
+    ({"check_type": "pattern", "sample_fraction": 0.001}, None),
+    ({"check_type": "pattern", "sample_fraction": 1.5}, None),
+    ({"check_type": "pattern", "sample_fraction": "0.1"}, None),
+    ({"check_type": "pattern"}, None),
+    ({"check_type": "completeness", "sample_fraction": 0.1}, None),
+])
+def test_sample_fraction(monitor, rule, fraction):
+    monitor._total_count = 1000000
+
+    assert monitor._sample_fraction(rule) == fraction
+
+
+def test_fused_result_scales_sampled_pattern_counts(monitor):
+    monitor._total_count = 1000000
+    rule = {"check_type": "pattern", "column": "zip", "pattern": "^[0-9]{5}$", "sample_fraction": 0.1}
+    aggregates = {
+        ("rows", 0.1): 100000,
+        ("non_null", "zip", 0.1): 90000,
+        ("match", "zip", "^[0-9]{5}$", 0.1): 81000,
+    }
+
+    result = monitor._fused_result(rule, aggregates)
+
+    assert result["total_count"] == 900000
+    assert result["match_count"] == 810000
+    assert result["match_percentage"] == pytest.approx(90.0)
+    assert result["sample_fraction"] == 0.1
+    assert result["passed"] is False
+
+
+def test_fused_result_completeness(monitor):
+    monitor._total_count = 200
+    rule = {"check_type": "completeness", "column": "status", "threshold": 5}
+
+    result = monitor._fused_result(rule, {("rows", None): 200, ("null", "status"): 4})
+
+    assert result["null_count"] == 4
+    assert result["null_percentage"] == 2.0
+    assert result["passed"] is True
+    assert "sample_fraction" not in result
+
+
+def test_fused_result_uniqueness_counts_null_as_value(monitor):
+    monitor._total_count = 10
+    rule = {"check_type": "uniqueness", "column": "order_id", "threshold": 100}
+    aggregates = {
+        ("rows", None): 10,
+        ("non_null", "order_id", None): 9,
+        ("distinct", "order_id"): 9,
+    }
+
+    result = monitor._fused_result(rule, aggregates)
+
+    assert result["unique_count"] == 10
+    assert result["passed"] is True
+
+
+def test_scheduler_mode(monitor):
+    monitor.spark.sparkContext.getConf.return_value.get.return_value = "fair"
+
+    assert monitor._scheduler_mode() == "FAIR"
+    monitor.spark.sparkContext.getConf.return_value.get.assert_called_once_with(
+        "spark.scheduler.mode", "FIFO"
+    )
+
+
+def test_generate_report(monitor):
+    results = [
+        {"check_type": "completeness", "passed": True},
+        {"check_type": "completeness", "passed": False, "rule_name": "status_complete"},
+        {"check_type": "pattern", "passed": True},
+        {"check_type": None, "passed": False, "error": "Unknown failure"},
+    ]
+
+    report = monitor.generate_report(results)
+
+    assert report["summary"] == {
+        "total_checks": 4,
+        "passed_checks": 2,
+        "failed_checks": 2,
+        "pass_percentage": 50.0,
+    }
+    assert report["by_check_type"] == {
+        "completeness": {"total": 2, "passed": 1, "failed": 1},
+        "pattern": {"total": 1, "passed": 1, "failed": 0},
+        None: {"total": 1, "passed": 0, "failed": 1},
+    }
+    assert report["failed_checks"] == [results[1], results[3]]
+
+
+def test_generate_report_without_results(monitor):
+    report = monitor.generate_report([])
+
+    assert report["summary"]["total_checks"] == 0
+    assert report["summary"]["pass_percentage"] == 100
+    assert report["by_check_type"] == {}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(dq_module, "orjson", None)
+    value = {"actual_max": Decimal("19.90"), "passed": True}
+
+    assert json.loads(_dumps(value)) == {"actual_max": "19.90", "passed": True}
+    assert b"\n" not in _dumps(value)
+    assert b"\n" in _dumps(value, indent=True)
+
+
+def test_save_results_writes_gzipped_json_lines(monitor, tmp_path):
+    monitor.metrics_path = str(tmp_path)
+    results = [{"check_type": "completeness", "passed": True}, {"check_type": "pattern", "passed": False}]
+
+    monitor.save_results(results)
+
+    (path,) = tmp_path.glob("sales_orders_*.jsonl.gz")
+    with gzip.open(path, "rt") as f:
+        assert [json.loads(line) for line in f] == results
+
+
+def test_monitors_sharing_a_rules_file_get_their_own_rules(tmp_path):
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps([{"rule_id": "r1", "check_type": "completeness", "threshold": 5}]))
+
+    first = DataQualityMonitor(MagicMock(), "sales", "orders", rules_path=str(rules_path))
+    second = DataQualityMonitor(MagicMock(), "sales", "orders", rules_path=str(rules_path))
+    first.rules[0]["threshold"] = 50
+
+    assert second.rules == [{"rule_id": "r1", "check_type": "completeness", "threshold": 5}]
+    assert dq_module._read_rules_cached.cache_info().maxsize == dq_module.RULES_CACHE_SIZE
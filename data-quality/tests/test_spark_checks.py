@@ -0,0 +1,209 @@
+"""Tests that run the monitor's checks as real Spark jobs on a local session."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from DataQualityMonitor import DataQualityMonitor
+
+ORDERS_SCHEMA = "order_id int, status string, amount double, zip string, customer_id int"
+
+ORDERS = [
+    (1, "shipped", 10.5, "12345", 100),
+    (2, "shipped", None, "1234", 101),
+    (3, None, float("nan"), "54321", 102),
+    (4, "pending", 99.0, None, 999),
+    (5, "pending", 0.5, "67890", None),
+    (5, "cancelled", 42.0, "ABCDE", 100),
+]
+
+
+@pytest.fixture
+def orders(spark):
+    df = spark.createDataFrame(ORDERS, ORDERS_SCHEMA)
+    df.createOrReplaceGlobalTempView("orders")
+    return df
+
+
+@pytest.fixture
+def spark_monitor(spark):
+    monitor = DataQualityMonitor(spark, "global_temp", "orders")
+    monitor.cloudwatch_client = MagicMock()
+    monitor.sns_client = MagicMock()
+    return monitor
+
+
+def test_value_range_check_reports_min_and_max(spark_monitor, orders):
+    result = spark_monitor.run_value_range_check(orders, "order_id", min_value=1, max_value=10)
+
+    assert result["actual_min"] == 1
+    assert result["actual_max"] == 5
+    assert result["passed"] is True
+
+
+def test_value_range_check_fails_outside_range(spark_monitor, orders):
+    result = spark_monitor.run_value_range_check(orders, "customer_id", min_value=100, max_value=500)
+
+    assert result["actual_min"] == 100
+    assert result["actual_max"] == 999
+    assert result["passed"] is False
+
+
+def test_value_range_check_on_all_null_column(spark_monitor, spark):
+    df = spark.createDataFrame([(None,), (None,)], "amount double")
+
+    result = spark_monitor.run_value_range_check(df, "amount", min_value=0)
+
+    assert result["actual_min"] is None
+    assert result["actual_max"] is None
+    assert result["passed"] is True
+
+
+@pytest.mark.parametrize("pattern, valid", [
+    (r"^\p{L}+$", True),
+    (r"^[0-9]{5}\z", True),
+    ("(?P<x>a)", False),
+    ("[0-9", False),
+])
+def test_is_valid_pattern_uses_java_syntax(spark_monitor, pattern, valid):
+    assert spark_monitor._is_valid_pattern(pattern) is valid
+
+
+@pytest.fixture
+def customers(spark):
+    df = spark.createDataFrame([(100,), (101,), (102,), (103,)], "id int")
+    df.createOrReplaceGlobalTempView("customers")
+    return df
+
+
+def _without_timestamp(result):
+    return {key: value for key, value in result.items() if key != "timestamp"}
+
+
+def test_fused_results_match_individual_checks(spark_monitor, orders):
+    spark_monitor.rules = [
+        {"check_type": "completeness", "column": "amount", "threshold": 10},
+        {"check_type": "completeness", "column": "status", "threshold": 20},
+        {"check_type": "uniqueness", "column": "order_id", "threshold": 100},
+        {"check_type": "uniqueness", "column": "customer_id", "threshold": 50,
+         "approximate": True, "rsd": 0.05},
+        {"check_type": "value_range", "column": "order_id", "min_value": 1, "max_value": 4},
+        {"check_type": "pattern", "column": "zip", "pattern": "^[0-9]{5}$"},
+    ]
+    spark_monitor._total_count = orders.count()
+
+    aggregates = spark_monitor._run_fused_aggregations(orders)
+
+    individual = [
+        spark_monitor.run_completeness_check(orders, "amount", 10, total_count=6),
+        spark_monitor.run_completeness_check(orders, "status", 20, total_count=6),
+        spark_monitor.run_uniqueness_check(orders, "order_id", 100, total_count=6),
+        spark_monitor.run_uniqueness_check(orders, "customer_id", 50, True, 0.05, total_count=6),
+        spark_monitor.run_value_range_check(orders, "order_id", 1, 4),
+        spark_monitor.run_pattern_check(orders, "zip", "^[0-9]{5}$"),
+    ]
+    fused = [spark_monitor._fused_result(rule, aggregates) for rule in spark_monitor.rules]
+
+    assert [_without_timestamp(r) for r in fused] == [_without_timestamp(r) for r in individual]
+    assert [r["passed"] for r in fused] == [False, True, False, True, False, False]
+    assert fused[0]["null_count"] == 2
+    assert fused[2]["unique_count"] == 5
+    assert fused[5]["match_count"] == 3
+
+
+def test_fused_aggregation_skips_invalid_rules(spark_monitor, orders):
+    spark_monitor.rules = [
+        {"check_type": "completeness", "column": "amount"},
+        {"check_type": "completeness", "column": "amonut"},
+        {"check_type": "completeness"},
+        {"check_type": "pattern", "column": "zip", "pattern": "(?P<x>a)"},
+        {"check_type": "uniqueness", "column": "order_id", "approximate": True, "rsd": "low"},
+    ]
+    spark_monitor._total_count = orders.count()
+
+    aggregates = spark_monitor._run_fused_aggregations(orders)
+
+    assert aggregates == {("rows", None): 6, ("null", "amount"): 2}
+
+
+def test_run_all_checks_keeps_rule_order_and_releases_cache(spark_monitor, spark, orders, customers):
+    spark_monitor.rules = [
+        {"rule_id": "r1", "check_type": "referential_integrity", "column": "customer_id",
+         "ref_database": "global_temp", "ref_table": "customers", "ref_column": "id"},
+        {"rule_id": "r2", "check_type": "completeness", "column": "missing_column"},
+        {"rule_id": "r3", "check_type": "uniqueness", "column": "order_id", "threshold": 100},
+        {"rule_id": "r4", "check_type": "referential_integrity", "column": "customer_id",
+         "ref_database": "global_temp", "ref_table": "customers", "ref_column": "id"},
+        {"rule_id": "r5", "check_type": "unknown", "column": "order_id"},
+        {"rule_id": "r6", "check_type": "pattern", "column": "zip", "pattern": "^[0-9]{5}$"},
+    ]
+
+    results = spark_monitor.run_all_checks()
+
+    assert [r["rule_id"] for r in results] == ["r1", "r2", "r3", "r4", "r6"]
+    assert "not found" in results[1]["error"]
+    assert results[0]["invalid_count"] == results[3]["invalid_count"] == 1
+    assert spark._jsparkSession.sharedState().cacheManager().isEmpty()
+    assert spark_monitor._ref_values == {}
+    assert spark_monitor._value_counts_cache == {}
+
+
+def test_run_all_checks_on_column_names_with_dots(spark_monitor, spark):
+    spark.createDataFrame([(1, "a"), (2, "b"), (None, "c")], "`order.id` int, status string") \
+        .createOrReplaceGlobalTempView("orders")
+    spark_monitor.rules = [
+        {"rule_id": "r1", "check_type": "completeness", "column": "`order.id`", "threshold": 50},
+        {"rule_id": "r2", "check_type": "uniqueness", "column": "`order.id`", "threshold": 100},
+    ]
+
+    results = spark_monitor.run_all_checks()
+
+    assert [r.get("error") for r in results] == [None, None]
+    assert results[0]["null_count"] == 1
+    assert results[1]["unique_count"] == 3
+
+
+@pytest.mark.parametrize("column", ["Amount", "`m.ratio`", "metrics.score"])
+def test_completeness_counts_nan_for_any_column_reference(spark_monitor, spark, column):
+    df = spark.createDataFrame(
+        [(1.0, 1.0, (1.0,)), (float("nan"), float("nan"), (float("nan"),)), (None, None, (None,))],
+        "amount double, `m.ratio` float, metrics struct<score: double>"
+    )
+    spark_monitor.rules = [{"check_type": "completeness", "column": column}]
+    spark_monitor._total_count = 3
+
+    individual = spark_monitor.run_completeness_check(df, column, 0, total_count=3)
+    fused = spark_monitor._fused_result(spark_monitor.rules[0], spark_monitor._run_fused_aggregations(df))
+
+    assert individual["null_count"] == fused["null_count"] == 2
+
+
+@pytest.mark.parametrize("broadcast_ref", [None, True, False])
+def test_referential_integrity_counts(spark_monitor, orders, customers, broadcast_ref):
+    result = spark_monitor.run_referential_integrity_check(
+        orders, "customer_id", "global_temp", "customers", "id", broadcast_ref=broadcast_ref
+    )
+
+    assert result["total_count"] == 5
+    assert result["invalid_count"] == 1
+    assert result["valid_percentage"] == pytest.approx(80.0)
+    assert result["passed"] is False
+
+
+def test_referential_integrity_with_cached_value_counts(spark_monitor, orders, customers):
+    spark_monitor._value_counts_cache["customer_id"] = spark_monitor._value_counts(orders, "customer_id")
+
+    for broadcast_ref in (None, True, False):
+        result = spark_monitor.run_referential_integrity_check(
+            orders, "customer_id", "global_temp", "customers", "id", broadcast_ref=broadcast_ref
+        )
+        assert (result["total_count"], result["invalid_count"]) == (5, 1)
+
+
+def test_referential_integrity_missing_reference_table(spark_monitor, orders):
+    result = spark_monitor.run_referential_integrity_check(
+        orders, "customer_id", "global_temp", "no_such_table", "id"
+    )
+
+    assert result["passed"] is False
+    assert result["valid_percentage"] is None
+    assert "error" in result